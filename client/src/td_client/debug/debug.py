@@ -28,6 +28,11 @@ class DebugRenderer:
         self.show_coords = settings.show_grid_coords
         self.show_info = False
 
+    @property
+    def enabled(self) -> bool:
+        """Whether any debug overlay is currently drawn."""
+        return self.show_grid or self.show_info
+
     def toggle_grid(self) -> None:
         self.show_grid = not self.show_grid
         self.show_coords = self.show_grid
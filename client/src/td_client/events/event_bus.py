@@ -15,6 +15,9 @@ Usage:
     # Publish events
     bus.publish(RoundStartEvent(round_start_pb=data))
 
+    # Defer an event to the next process_pending() call
+    bus.post(RequestBuildTowerEvent(...))
+
     # Process queued events (call this in the main loop)
     bus.process_pending()
 """
@@ -115,8 +118,20 @@ class EventBus:
                     len(self._pending_events),
                 )
 
+    def post(self, event: Event) -> None:
+        """Queue an event for dispatch on the next `process_pending()` call.
+
+        Unlike `publish()`, this never invokes handlers inline, so the caller
+        (e.g. an input handler) returns without waiting on subscribers.
+
+        Args:
+            event: The event to queue
+        """
+        with self._pending_lock:
+            self._pending_events.append(event)
+
     def process_pending(self) -> int:
-        """Process all pending events queued from background threads.
+        """Process all pending events queued from background threads or `post()`.
 
         This should be called once per frame in the main game loop.
 
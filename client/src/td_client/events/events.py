@@ -209,6 +209,7 @@ class GoldChangedEvent(StateEvent):
     player_id: PlayerID
     new_gold: int
     delta: int = 0  # Positive for gain, negative for spend
+    sync_correction: bool = False  # Resync to the server total, not a gain/spend
 
 
 @dataclass(frozen=True)
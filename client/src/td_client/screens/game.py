@@ -8,6 +8,7 @@ import pygame
 from td_shared import PlayerID, RoundStartData, SimulationData, proto_to_sim_data
 
 from td_client.events import (
+    GoldChangedEvent,
     RoundResultEvent,
     RoundStartEvent,
     TowerPlacedEvent,
@@ -197,14 +198,15 @@ class GameScreen(Screen):
             if self.player_id == "A"
             else event.gold_earned_player_B
         )
-        if gold_earned > 0:
-            self.game.ui_state.gold_flash_timer = 0.5
-            self.game.ui_state.gold_flash_color = (
-                100,
-                255,
-                100,
-            )  # Green flash for gain
-            self.game.ui_state.gold_display_scale = 1.2
+        if gold_earned > 0 and self.app.event_bus:
+            # The HUD owns the flash/pulse state and turns this into a green flash
+            self.app.event_bus.publish(
+                GoldChangedEvent(
+                    player_id=self.player_id,
+                    new_gold=self.game.player_state.my_gold,
+                    delta=gold_earned,
+                )
+            )
 
         # 2. CHECK FOR GAME OVER
         my_lives = self.game.player_state.my_lives
@@ -274,9 +276,11 @@ class GameScreen(Screen):
         if not self.game:
             return
 
-        gold_mines = self.game.ui_state.local_gold_mines
+        local_buildings = self.game.ui_state.local_buildings
+        gold_mine_keys = self.game.ui_state.gold_mine_keys
 
-        for sprite in gold_mines.values():
+        for key in gold_mine_keys:
+            sprite = local_buildings[key]
             # Play gold spawn effect at the mine's position
             if (
                 hasattr(self.game.sim_state, "render_manager")
@@ -297,7 +301,7 @@ class GameScreen(Screen):
                 }
             )
 
-        if gold_mines:
+        if gold_mine_keys:
             # Calculate total gold from all mine text
             total_gold_from_mines = reduce(
                 lambda acc, text_data: acc + text_data.get("amount", 0),
@@ -305,7 +309,7 @@ class GameScreen(Screen):
                 0,
             )
             logger.info(
-                f"Played gold spawn effects for {len(gold_mines)} gold mines (total: {total_gold_from_mines}g)"
+                f"Played gold spawn effects for {len(gold_mine_keys)} gold mines (total: {total_gold_from_mines}g)"
             )
 
     def _update_gold_mine_states(self, active: bool) -> None:
@@ -314,7 +318,9 @@ class GameScreen(Screen):
             return
 
         # Update locally placed gold mines
-        for sprite in self.game.ui_state.local_gold_mines.values():
+        local_buildings = self.game.ui_state.local_buildings
+        for key in self.game.ui_state.gold_mine_keys:
+            sprite = local_buildings[key]
             if hasattr(sprite, "set_active"):
                 sprite.set_active(active)
 
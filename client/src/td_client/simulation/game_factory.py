@@ -201,7 +201,7 @@ class GameFactory:
         ), "combat_seconds_total must be > 0"
 
         # UI elements
-        game.sim_state.hud_renderer = HUDRenderer()
+        game.sim_state.hud_renderer = HUDRenderer(game)
         GameFactory._initialize_ui_buttons(game)
 
     @staticmethod
@@ -262,8 +262,8 @@ class GameFactory:
 
         # --- 4. INITIALER STATUS ---
         game.ui_state.selected_unit_type = "standard"
-        game.ui_state.selected_building_type = "standard"
+        game.ui_state.select_building("standard")
         game.ui_state.tower_build_mode = False
         game.ui_state.hover_tile = None
-        game.ui_state.local_towers = {}
-        game.ui_state.local_gold_mines = {}
+        game.ui_state.local_buildings = {}
+        game.ui_state.gold_mine_keys = set()
@@ -145,11 +145,6 @@ class GameSimulation:
         """Access barracks buttons from ui_state."""
         return self.ui_state.barracks_buttons
 
-    @property
-    def _local_towers(self):
-        """Access local towers dict from ui_state."""
-        return self.ui_state.local_towers
-
     @property
     def render_manager(self):
         """Access render manager from sim_state."""
@@ -233,6 +228,7 @@ class GameSimulation:
 
     def update(self, dt: float) -> None:
         """Update simulation, visuals, timers and RoundAck logic."""
+        self.sim_state.build_controller.flush_gold()
         self.sim_state.wave_simulator.update(dt)
         self.sim_state.render_manager.update(dt)
 
@@ -393,6 +389,8 @@ class GameSimulation:
 
     def cleanup(self) -> None:
         """Clean up resources when the game simulation is destroyed."""
+        if self.sim_state.hud_renderer:
+            self.sim_state.hud_renderer.cleanup()
         self._clear_local_towers()
         self._clear_gold_mines()
         logger.info("GameSimulation cleaned up")
@@ -400,18 +398,22 @@ class GameSimulation:
     # helpers for tower management
     def _clear_local_towers(self) -> None:
         """Remove all locally-spawned tower sprites."""
-        list(map(lambda s: s.kill(), self.ui_state.local_towers.values()))
-        self.ui_state.local_towers.clear()
+        local_buildings = self.ui_state.local_buildings
+        for key in local_buildings.keys() - self.ui_state.gold_mine_keys:
+            local_buildings.pop(key).kill()
 
     def _clear_gold_mines(self) -> None:
         """Remove all locally-spawned gold mine sprites."""
-        list(map(lambda s: s.kill(), self.ui_state.local_gold_mines.values()))
-        self.ui_state.local_gold_mines.clear()
+        for key in self.ui_state.gold_mine_keys:
+            self.ui_state.local_buildings.pop(key).kill()
+        self.ui_state.gold_mine_keys.clear()
 
     def _update_gold_mine_states(self, active: bool) -> None:
         """Update all gold mines to active or inactive state."""
         # Update locally placed gold mines
-        for sprite in self.ui_state.local_gold_mines.values():
+        local_buildings = self.ui_state.local_buildings
+        for key in self.ui_state.gold_mine_keys:
+            sprite = local_buildings[key]
             if hasattr(sprite, "set_active"):
                 sprite.set_active(active)
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections import defaultdict, deque
 from dataclasses import dataclass
 
 import pygame
-from td_shared import PlacementGrid
+from td_shared import TOWER_STATS, PlacementGrid, TowerStats
 
 from ..debug import DebugRenderer
 from ..map import TileMap
@@ -12,6 +13,9 @@ from ..sprites import BuildingSprite
 from ..ui import BuildController, HUDRenderer, InputController
 from .wave_simulator import WaveSimulator
 
+# Upper bound on queued unit previews shown per route
+MAX_PREVIEWS_PER_ROUTE = 64
+
 
 @dataclass
 class MapState:
@@ -63,15 +67,18 @@ class UIState:
     building_selection_buttons: list[tuple[pygame.Rect, str]] = None  # List of (Rect, building_type)
     selected_unit_type: str = "standard" # Default to Warrior
     selected_building_type: str = "standard"  # Default tower type
+    selected_building_stats: TowerStats | None = None  # TOWER_STATS entry for the selection
+    selected_building_cost: int = 0  # Cached int cost of the selected building
     tower_build_mode: bool = False
     hover_tile: tuple[int, int] | None = None
     hovered_route: int | None = None  # Route number (1-5) being hovered, or None
     last_clicked_route: int | None = None  # Last clicked route for visual feedback
     click_time: float = 0.0  # Time when route was last clicked
-    local_towers: dict[tuple[str, int, int], BuildingSprite] = None
-    local_gold_mines: dict[tuple[str, int, int], BuildingSprite] = None  # Track gold mines separately
+    current_mods: int = 0  # Keyboard modifier state, sampled on each left click
+    local_buildings: dict[int, BuildingSprite] = None  # Keyed by building_key(player, row, col)
+    gold_mine_keys: set[int] = None  # Keys in local_buildings that are gold mines
     tower_button_hovered: bool = False
-    route_unit_previews: dict[int, list[str]] | None = None
+    route_unit_previews: dict[int, deque[str]] | None = None
     route_preview_sprites: list = None
     route_preview_sprites: list = None
     floating_gold_texts: list = None  # List of floating gold change indicators
@@ -86,16 +93,20 @@ class UIState:
         """Initialize mutable defaults."""
         if self.barracks_buttons is None:
             self.barracks_buttons = []
-        if self.local_towers is None:
-            self.local_towers = {}
-        if self.local_gold_mines is None:
-            self.local_gold_mines = {}
+        if self.selected_building_stats is None:
+            self.select_building(self.selected_building_type)
+        if self.local_buildings is None:
+            self.local_buildings = {}
+        if self.gold_mine_keys is None:
+            self.gold_mine_keys = set()
         if self.unit_selection_buttons is None:
             self.unit_selection_buttons = []
         if self.building_selection_buttons is None:
             self.building_selection_buttons = []
         if self.route_unit_previews is None:
-            self.route_unit_previews = {}
+            self.route_unit_previews = defaultdict(
+                lambda: deque(maxlen=MAX_PREVIEWS_PER_ROUTE)
+            )
         if self.route_preview_sprites is None:
             self.route_preview_sprites = []
         if self.route_preview_sprites is None:
@@ -111,6 +122,16 @@ class UIState:
             if self.gold_flash_color is None:
                 self.gold_flash_color = (255, 255, 255)
 
+    def select_building(self, building_type: str) -> None:
+        """Select a building type and cache its stats and cost."""
+        self.selected_building_type = building_type
+        self.selected_building_stats = TOWER_STATS.get(building_type)
+        self.selected_building_cost = (
+            int(self.selected_building_stats["cost"])
+            if self.selected_building_stats
+            else 0
+        )
+
 
 @dataclass
 class SimulationState:
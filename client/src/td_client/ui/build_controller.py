@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
 import pygame
@@ -24,6 +25,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def building_key(player_id: str, row: int, col: int) -> int:
+    """Pack (player_id, row, col) into a single int key for the sprite dicts."""
+    # Preconditions: col fits in 8 bits and the player fits in the low bit
+    assert 0 <= col < 256, f"col must be in [0, 256) to pack, not {col}"
+    assert row >= 0, f"row must be >= 0, not {row}"
+    assert player_id in ("A", "B"), f"player_id must be 'A' or 'B', not {player_id!r}"
+    return (row << 8 | col) << 1 | (player_id == "B")
+
+
 class BuildController:
     """Handles build mode interactions.
 
@@ -39,10 +49,21 @@ class BuildController:
     4. BuildController handles response (rollback if failed)
     """
 
+    __slots__ = (
+        "game",
+        "event_bus",
+        "_subscriptions",
+        "_pending_gold_delta",
+        "_pending_gold_new",
+    )
+
     def __init__(self, game: GameSimulation):
         self.game = game
         self.event_bus: EventBus | None = game.event_bus
         self._subscriptions: list = []
+        # Gold spent this frame, coalesced into a single GoldChangedEvent
+        self._pending_gold_delta = 0
+        self._pending_gold_new = 0
 
         # Subscribe to server response events
         if self.event_bus:
@@ -63,6 +84,25 @@ class BuildController:
             unsub()
         self._subscriptions.clear()
 
+    def flush_gold(self) -> None:
+        """Publish one GoldChangedEvent for all gold spent since the last flush.
+
+        Called once per frame so rapid clicks (e.g. shift-building) notify
+        subscribers once instead of once per action.
+        """
+        if self._pending_gold_delta == 0:
+            return
+        delta = self._pending_gold_delta
+        self._pending_gold_delta = 0
+        if self.event_bus:
+            self.event_bus.publish(
+                GoldChangedEvent(
+                    player_id=self.game.player_id,
+                    new_gold=self._pending_gold_new,
+                    delta=delta,
+                )
+            )
+
     def _get_my_map_and_grid(self, game=None):
         target = game or self.game
         return target.terrain_map, target.get_player_grid(target.player_id)
@@ -72,14 +112,10 @@ class BuildController:
         mx, my = event.pos
         my_map, my_grid = self._get_my_map_and_grid(game)
 
-        # Check for route button hover
+        # Check for route button hover (single C-level scan over all buttons)
         old_hovered_route = game.ui_state.hovered_route
-        new_hovered_route = None
-        buttons = game.ui_state.barracks_buttons
-        for idx, rect in enumerate(buttons, start=1):
-            if rect.collidepoint(mx, my):
-                new_hovered_route = idx
-                break
+        idx = pygame.Rect(mx, my, 1, 1).collidelist(game.ui_state.barracks_buttons)
+        new_hovered_route = idx + 1 if idx >= 0 else None
 
         # Update route hover state and publish event if changed
         if old_hovered_route != new_hovered_route:
@@ -116,22 +152,20 @@ class BuildController:
         mx, my = event.pos
 
         # Priority 1: Send units buttons (unverändert)
-        for idx, rect in enumerate(game.ui_state.barracks_buttons, start=1):
-            if rect.collidepoint(mx, my):
-                import time
-
-                game.audio.play_ui_sound("button")
-                game.ui_state.last_clicked_route = idx
-                game.ui_state.click_time = time.time()
-                
-                # Check if shift is held - if so, send 5 units
-                mods = pygame.key.get_mods()
-                shift_held = bool(mods & pygame.KMOD_SHIFT)
-                count = 5 if shift_held else 1
-                
-                for _ in range(count):
-                    self._request_send_units(game, idx)
-                return
+        idx = pygame.Rect(mx, my, 1, 1).collidelist(game.ui_state.barracks_buttons)
+        if idx >= 0:
+            route = idx + 1
+            game.audio.play_ui_sound("button")
+            game.ui_state.last_clicked_route = route
+            game.ui_state.click_time = time.monotonic()
+
+            # Check if shift is held - if so, send 5 units
+            shift_held = bool(game.ui_state.current_mods & pygame.KMOD_SHIFT)
+            count = 5 if shift_held else 1
+
+            for _ in range(count):
+                self._request_send_units(game, route)
+            return
 
         # Priority 2: Unit Selection Buttons (unverändert)
         for rect, u_type in game.ui_state.unit_selection_buttons:
@@ -145,7 +179,7 @@ class BuildController:
         for rect, b_type in game.ui_state.building_selection_buttons:
             if rect.collidepoint(mx, my):
                 game.audio.play_ui_sound("button")
-                game.ui_state.selected_building_type = b_type
+                game.ui_state.select_building(b_type)
                 game.ui_state.tower_build_mode = True  # Sofort aktivieren
                 logger.info(f"Building selected: {b_type}, Build Mode ON")
                 return
@@ -187,33 +221,19 @@ class BuildController:
         # Optimistic gold deduction
         game.player_state.my_gold -= unit_cost
 
-
-        # Trigger green flash on gold display
-        game.ui_state.gold_flash_timer = 0.5
-        game.ui_state.gold_flash_color = (255, 100, 100)  # Red flash for spend
-        game.ui_state.gold_display_scale = 1.2  # Pulse effect
-
         logger.info(
             f"Barracks button clicked: route {route}. Optimistically deducted {unit_cost} gold."
         )
 
-        # Publish gold changed event
-        if self.event_bus:
-            self.event_bus.publish(
-                GoldChangedEvent(
-                    player_id=game.player_id,
-                    new_gold=game.player_state.my_gold,
-                    delta=-unit_cost,
-                )
-            )
+        # Queue gold change - published once per frame by flush_gold()
+        self._pending_gold_delta -= unit_cost
+        self._pending_gold_new = game.player_state.my_gold
 
         # Publish request event - NetworkHandler will handle the network call
         if self.event_bus:
             # Track locally for UI preview
-            game.ui_state.route_unit_previews.setdefault(route, []).append(
-                unit_type_to_send
-            )
-            self.event_bus.publish(
+            game.ui_state.route_unit_previews[route].append(unit_type_to_send)
+            self.event_bus.post(
                 RequestSendUnitsEvent(
                     player_id=game.player_id,
                     unit_type=unit_type_to_send,
@@ -232,54 +252,44 @@ class BuildController:
             return
 
         my_map, my_grid = self._get_my_map_and_grid(game)
-        if not my_map.rect.collidepoint(mx, my):
-            return
 
-        local_x = mx - my_map.rect.x
-        local_y = my - my_map.rect.y
-        row, col = my_grid.pixel_to_grid_coords(local_x, local_y)
+        # handle_mouse_motion already resolved the cursor to a buildable tile
+        hover = game.ui_state.hover_tile
+        if hover is not None:
+            row, col = hover
+        else:
+            if not my_map.rect.collidepoint(mx, my):
+                return
+
+            local_x = mx - my_map.rect.x
+            local_y = my - my_map.rect.y
+            row, col = my_grid.pixel_to_grid_coords(local_x, local_y)
 
         # Get the selected building type
         building_type = game.ui_state.selected_building_type
-        tower_stats = TOWER_STATS.get(building_type)
-        if not tower_stats:
+        if not game.ui_state.selected_building_stats:
             logger.warning("Unknown building type: %s", building_type)
             return
-        tower_cost = int(tower_stats["cost"])
+        tower_cost = game.ui_state.selected_building_cost
 
         # Validation: Check all build conditions
-        validation_checks = [
-            (
-                "tile_buildable",
-                my_grid.is_buildable(row, col),
-                f"Cannot build tower at ({row},{col}) - tile not buildable",
-            ),
-            (
-                "enough_gold",
-                game.player_state.my_gold >= tower_cost,
-                f"Not enough gold to build tower. Have {game.player_state.my_gold}, need {tower_cost}.",
-            ),
-        ]
-
-        # check if all validations pass
-        if not all(check[1] for check in validation_checks):
-            # Find first failed check and log warning
-            failed_check = next(
-                (check for check in validation_checks if not check[1]), None
+        if not my_grid.is_buildable(row, col):
+            logger.warning(
+                "Cannot build tower at (%d,%d) - tile not buildable", row, col
+            )
+            return
+        if game.player_state.my_gold < tower_cost:
+            logger.warning(
+                "Not enough gold to build tower. Have %d, need %d.",
+                game.player_state.my_gold,
+                tower_cost,
             )
-            if failed_check:
-                logger.warning(failed_check[2])
             return
 
         # Capture state before build attempt for rollback
         was_empty = True  # We already validated it's buildable
-        sprite_existed = (game.player_id, row, col) in game.ui_state.local_towers
-        if building_type == "gold_mine":
-            sprite_existed = (
-                game.player_id,
-                row,
-                col,
-            ) in game.ui_state.local_gold_mines
+        key = building_key(game.player_id, row, col)
+        sprite_existed = key in game.ui_state.local_buildings
 
         # Optimistic updates
         old_gold = game.player_state.my_gold
@@ -298,25 +308,14 @@ class BuildController:
         # Play deploy sound
         game.audio.play_unit_sound("tower", "deploy")
 
-        # Trigger green flash on gold display
-        game.ui_state.gold_flash_timer = 0.5
-        game.ui_state.gold_flash_color = (255, 100, 100)  # Red flash for spend
-        game.ui_state.gold_display_scale = 1.2  # Pulse effect
-
         my_grid.place_tower(row, col)
         sprite_created = self.spawn_tower(game.player_id, row, col, building_type)
 
-        # Postcondition: If sprite was created, it should exist in appropriate dict
-        key = (game.player_id, row, col)
+        # Postcondition: If sprite was created, it should be registered
         if sprite_created:
-            if building_type == "gold_mine":
-                assert (
-                    key in game.ui_state.local_gold_mines
-                ), f"Gold mine should exist in local_gold_mines after creation at ({row}, {col})"
-            else:
-                assert (
-                    key in game.ui_state.local_towers
-                ), f"Tower should exist in local_towers after creation at ({row}, {col})"
+            assert (
+                key in game.ui_state.local_buildings
+            ), f"Building should exist in local_buildings after creation at ({row}, {col})"
 
         logger.info(
             "Placing %s at (%d,%d), sending request... (sprite existed: %s, created: %s)",
@@ -327,19 +326,13 @@ class BuildController:
             sprite_created,
         )
 
-        # Publish gold changed event
-        if self.event_bus:
-            self.event_bus.publish(
-                GoldChangedEvent(
-                    player_id=game.player_id,
-                    new_gold=game.player_state.my_gold,
-                    delta=-tower_cost,
-                )
-            )
+        # Queue gold change - published once per frame by flush_gold()
+        self._pending_gold_delta -= tower_cost
+        self._pending_gold_new = game.player_state.my_gold
 
         # Publish request event - NetworkHandler will handle the network call
         if self.event_bus:
-            self.event_bus.publish(
+            self.event_bus.post(
                 RequestBuildTowerEvent(
                     player_id=game.player_id,
                     tower_type=building_type,
@@ -353,8 +346,7 @@ class BuildController:
             logger.error("No event bus available - cannot send build tower request")
 
         # Check if shift is held - if so, stay in build mode
-        mods = pygame.key.get_mods()
-        shift_held = bool(mods & pygame.KMOD_SHIFT)
+        shift_held = bool(game.ui_state.current_mods & pygame.KMOD_SHIFT)
 
         if not shift_held:
             # Exit build mode only if shift is not held
@@ -380,87 +372,41 @@ class BuildController:
             )
             # Postcondition: If we optimistically created a sprite, it should still exist
             if not event.sprite_existed:
-                key = (self.game.player_id, event.tile_row, event.tile_col)
-                if event.tower_type == "gold_mine":
-                    assert (
-                        key in self.game.ui_state.local_gold_mines
-                    ), f"Gold mine should exist at ({event.tile_row}, {event.tile_col}) after success"
-                else:
-                    assert (
-                        key in self.game.ui_state.local_towers
-                    ), f"Tower should exist at ({event.tile_row}, {event.tile_col}) after success"
+                key = building_key(self.game.player_id, event.tile_row, event.tile_col)
+                assert (
+                    key in self.game.ui_state.local_buildings
+                ), f"Building should exist at ({event.tile_row}, {event.tile_col}) after success"
             return
 
+        tower_stats = TOWER_STATS.get(event.tower_type, TOWER_STATS["standard"])
+        self._rollback_build(event, int(tower_stats["cost"]))
+
+    def _rollback_build(self, event: BuildTowerResponseEvent, tower_cost: int) -> None:
+        """Undo an optimistic build: refund gold, drop the sprite, free the tile."""
+        game = self.game
+        game.player_state.my_gold += tower_cost
+        self.remove_tower(game.player_id, event.tile_row, event.tile_col)
+        if event.was_empty:
+            game.get_player_grid(game.player_id).clear_tower(
+                event.tile_row, event.tile_col
+            )
+
         logger.warning(
-            "BuildTower rejected at (%d,%d), rolling back",
+            "BuildTower rejected, rolled back %s at (%d,%d)",
+            event.tower_type,
             event.tile_row,
             event.tile_col,
         )
 
-        # Rollback gold based on the tower type that was attempted
-        tower_stats = TOWER_STATS.get(event.tower_type, TOWER_STATS["standard"])
-        tower_cost = int(tower_stats["cost"])
-        old_gold = self.game.player_state.my_gold
-        self.game.player_state.my_gold += tower_cost
-
-        # Postcondition: Gold should be refunded
-        assert (
-            self.game.player_state.my_gold == old_gold + tower_cost
-        ), f"Gold not correctly refunded: expected {old_gold + tower_cost}, got {self.game.player_state.my_gold}"
-
-        # Trigger green flash on gold display (refund)
-        self.game.ui_state.gold_flash_timer = 0.5
-        self.game.ui_state.gold_flash_color = (100, 255, 100)  # Green flash for gain
-        self.game.ui_state.gold_display_scale = 1.2  # Pulse effect
-
         if self.event_bus:
             self.event_bus.publish(
                 GoldChangedEvent(
-                    player_id=self.game.player_id,
-                    new_gold=self.game.player_state.my_gold,
+                    player_id=game.player_id,
+                    new_gold=game.player_state.my_gold,
                     delta=tower_cost,
                 )
             )
 
-        # Rollback sprite
-        key = (self.game.player_id, event.tile_row, event.tile_col)
-        sprite_exists_now = False
-        if event.tower_type == "gold_mine":
-            sprite_exists_now = key in self.game.ui_state.local_gold_mines
-        else:
-            sprite_exists_now = key in self.game.ui_state.local_towers
-
-        # Always remove sprite if it exists (optimistic creation should be rolled back)
-        if sprite_exists_now:
-            self.remove_tower(
-                self.game.player_id, event.tile_row, event.tile_col, event.tower_type
-            )
-            logger.info(
-                "Rolled back %s at (%d,%d) - removed sprite",
-                event.tower_type,
-                event.tile_row,
-                event.tile_col,
-            )
-            # Postcondition: Sprite should be removed
-            if event.tower_type == "gold_mine":
-                assert (
-                    key not in self.game.ui_state.local_gold_mines
-                ), f"Gold mine should be removed from local_gold_mines at ({event.tile_row}, {event.tile_col})"
-            else:
-                assert (
-                    key not in self.game.ui_state.local_towers
-                ), f"Tower should be removed from local_towers at ({event.tile_row}, {event.tile_col})"
-
-        # Rollback grid if it was empty
-        if event.was_empty:
-            my_grid = self.game.get_player_grid(self.game.player_id)
-            my_grid.clear_tower(event.tile_row, event.tile_col)
-            logger.info(
-                "Rolled back tower at (%d,%d) - cleared grid",
-                event.tile_row,
-                event.tile_col,
-            )
-
     def _on_send_units_response(self, event: SendUnitsResponseEvent) -> None:
         """Handle send units response - sync gold with server."""
         if event.success and event.total_gold is not None:
@@ -474,6 +420,7 @@ class BuildController:
                         player_id=self.game.player_id,
                         new_gold=event.total_gold,
                         delta=event.total_gold - old_gold,
+                        sync_correction=True,
                     )
                 )
         elif not event.success and event.total_gold is not None:
@@ -493,20 +440,17 @@ class BuildController:
                         player_id=self.game.player_id,
                         new_gold=event.total_gold,
                         delta=event.total_gold - old_gold,
+                        sync_correction=True,
                     )
                 )
 
     def spawn_tower(self, player_id: str, row: int, col: int, tower_type: str) -> bool:
         """Spawn a tower sprite. Returns True if new sprite was created."""
-        key = (player_id, row, col)
+        key = building_key(player_id, row, col)
 
-        # Check if sprite already exists in appropriate dict
-        if tower_type == "gold_mine":
-            if key in self.game.ui_state.local_gold_mines:
-                return False
-        else:
-            if key in self.game.ui_state.local_towers:
-                return False
+        # Check if a sprite already exists on this tile
+        if key in self.game.ui_state.local_buildings:
+            return False
 
         tmap = self.game.terrain_map
         tower_info = TOWER_STATS.get(tower_type)
@@ -538,7 +482,7 @@ class BuildController:
 
             self.game.render_manager.animation_manager.register(sprite)
             self.game.render_manager.buildings.add(sprite)
-            self.game.ui_state.local_towers[key] = sprite
+            self.game.ui_state.local_buildings[key] = sprite
 
         elif tower_type == "wood_tower":
             from ..sprites.buildings import AnimatedTowerSprite
@@ -561,7 +505,7 @@ class BuildController:
 
             self.game.render_manager.animation_manager.register(sprite)
             self.game.render_manager.buildings.add(sprite)
-            self.game.ui_state.local_towers[key] = sprite
+            self.game.ui_state.local_buildings[key] = sprite
 
         elif tower_type == "gold_mine":
             from ..sprites.buildings import GoldMineSprite
@@ -582,7 +526,8 @@ class BuildController:
                 sprite.set_active(False)
 
             self.game.render_manager.buildings.add(sprite)
-            self.game.ui_state.local_gold_mines[key] = sprite
+            self.game.ui_state.local_buildings[key] = sprite
+            self.game.ui_state.gold_mine_keys.add(key)
         else:
             # Fallback for other towers (static)
             from ..sprites.buildings import BuildingSprite
@@ -592,24 +537,22 @@ class BuildController:
                 return False
             sprite = BuildingSprite(x=x, y=y, image=image, range_px=range_px)
             self.game.render_manager.buildings.add(sprite)
-            self.game.ui_state.local_towers[key] = sprite
+            self.game.ui_state.local_buildings[key] = sprite
 
         return True
 
-    def remove_tower(
-        self, player_id: str, row: int, col: int, tower_type: str = "standard"
-    ) -> None:
-        """Remove a tower sprite."""
-        key = (player_id, row, col)
+    def remove_tower(self, player_id: str, row: int, col: int) -> bool:
+        """Remove a tower or gold mine sprite. Returns True if one was removed."""
+        key = building_key(player_id, row, col)
+        sprite = self.game.ui_state.local_buildings.pop(key, None)
+        self.game.ui_state.gold_mine_keys.discard(key)
 
-        if tower_type == "gold_mine":
-            sprite = self.game.ui_state.local_gold_mines.pop(key, None)
-        else:
-            sprite = self.game.ui_state.local_towers.pop(key, None)
+        if sprite is None:
+            return False
 
-        if sprite:
-            # If it was animated, we must unregister it
-            if hasattr(sprite, "update_animation"):
-                self.game.render_manager.animation_manager.unregister(sprite)
+        # If it was animated, we must unregister it
+        if hasattr(sprite, "update_animation"):
+            self.game.render_manager.animation_manager.unregister(sprite)
 
-            sprite.kill()
+        sprite.kill()
+        return True
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import math
 import time
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import pygame
-from td_shared.game import GAME_PATHS, TILE_SIZE_PX, UNIT_STATS
+from td_shared.game import GAME_PATHS, TILE_SIZE_PX, TOWER_STATS, UNIT_STATS
+
+from td_client.events import GoldChangedEvent
+
+from ..sprites.units import UnitSprite
+
+if TYPE_CHECKING:
+    from ..simulation.game_simulation import GameSimulation
 
 # Unit descriptions for tooltips
 UNIT_DESCRIPTIONS = {
@@ -23,68 +33,190 @@ UNIT_DESCRIPTIONS = {
 }
 
 
+@lru_cache(maxsize=256)
+def _render_text(
+    font: pygame.font.Font, text: str, color: tuple[int, int, int]
+) -> pygame.Surface:
+    """Render antialiased text, reusing the surface for repeated (font, text, color).
+
+    Callers must not modify the returned surface since it is shared.
+    """
+    return font.render(text, True, color)
+
+
+@lru_cache(maxsize=64)
+def _render_button(
+    size: tuple[int, int],
+    color: tuple[int, int, int],
+    border_radius: int,
+    border_color: tuple[int, int, int] | None = None,
+) -> pygame.Surface:
+    """Rasterize a rounded button background (and optional 2px border) once.
+
+    Corners outside the radius stay fully transparent, so blitting the result
+    looks the same as drawing the rects directly. The surface is shared.
+    """
+    button = pygame.Surface(size, pygame.SRCALPHA)
+    rect = button.get_rect()
+    pygame.draw.rect(button, color, rect, border_radius=border_radius)
+    if border_color is not None:
+        pygame.draw.rect(
+            button, border_color, rect, width=2, border_radius=border_radius
+        )
+    return button
+
+
+@lru_cache(maxsize=64)
+def _render_anchored_text(
+    font: pygame.font.Font,
+    text: str,
+    color: tuple[int, int, int],
+    anchor_x: int,
+    align: str,
+) -> tuple[pygame.Surface, int]:
+    """Render text and return it with the left x that puts it at `anchor_x`.
+
+    `align` is "right" (text ends at anchor_x) or "center" (text is centered
+    on anchor_x). The anchor is part of the key, so a different screen width
+    simply yields new entries.
+    """
+    assert align in ("right", "center"), f"Unknown align: {align}"
+    text_surf = _render_text(font, text, color)
+    width = text_surf.get_width()
+    x = anchor_x - width if align == "right" else anchor_x - width // 2
+    return text_surf, x
+
+
 class HUDRenderer:
     """Renders HUD, buttons, timers, and overlays."""
 
+    def __init__(self, game: GameSimulation):
+        self.game = game
+        self._subscriptions: list = []
+        # Fonts by point size, created lazily (pygame.font must be initialized)
+        self._fonts: dict[int, pygame.font.Font] = {}
+        # Pre-rendered "Route N" labels, rebuilt when the button layout changes
+        self._route_labels: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._route_labels_layout: tuple[tuple[int, int, int, int], ...] = ()
+        # Last drawn timer per label: (whole seconds, center x, surface, left x)
+        self._timer_texts: dict[str, tuple[int, int, pygame.Surface, int]] = {}
+        # Darkened tile under the cursor in build mode
+        self._hover_surface = pygame.Surface(
+            (TILE_SIZE_PX, TILE_SIZE_PX), pygame.SRCALPHA
+        )
+        self._hover_surface.fill((0, 0, 0, 80))
+        # Translucent tile blitted onto every tile of the hovered route
+        self._highlight_surface = pygame.Surface(
+            (TILE_SIZE_PX, TILE_SIZE_PX), pygame.SRCALPHA
+        )
+        self._highlight_surface.fill((255, 220, 100, 100))
+        # Highlight blit sequences per (player_id, route) for the terrain origin
+        self._route_blits: dict[
+            tuple[str, int], list[tuple[pygame.Surface, tuple[int, int]]]
+        ] = {}
+        self._route_blits_origin: tuple[int, int] | None = None
+
+        # The HUD owns the gold flash/pulse animation state
+        if game.event_bus:
+            self._subscriptions.append(
+                game.event_bus.subscribe(GoldChangedEvent, self._on_gold_changed)
+            )
+
+    def cleanup(self) -> None:
+        """Unsubscribe from all events."""
+        for unsub in self._subscriptions:
+            unsub()
+        self._subscriptions.clear()
+
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """Return the default font at `size`, creating it on first use."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def _on_gold_changed(self, event: GoldChangedEvent) -> None:
+        """Flash and pulse the gold display: red for spend, green for gain."""
+        # Server resyncs (e.g. acks while shift-sent units are still queued)
+        # are not real gains or spends, so they must not flash
+        if event.delta == 0 or event.sync_correction:
+            return
+        ui_state = self.game.ui_state
+        ui_state.gold_flash_timer = 0.5
+        ui_state.gold_flash_color = (
+            (255, 100, 100) if event.delta < 0 else (100, 255, 100)
+        )
+        ui_state.gold_display_scale = 1.2  # Pulse effect
+
     def render(self, game) -> None:
+        # Bind the state containers once; they are read throughout the frame
+        ui = game.ui_state
+        ps = game.player_state
+        phase = game.phase_state
         surface = game.display_manager.render_surface
+        screen_w = game.display_manager.screen_width
+        map_origin = game.map_state.terrain_map.rect.topleft
         mx, my = pygame.mouse.get_pos()
 
         # 1. Route path highlight
-        hovered_route = game.ui_state.hovered_route
+        hovered_route = ui.hovered_route
         if hovered_route is not None:
             self._render_route_highlight(surface, game, hovered_route)
 
         # 2. Basic HUD (Gold and Lives)
-        font = pygame.font.Font(None, 28)
+        font = self._get_font(28)
 
         # Animate gold display scale (pulse effect)
         target_scale = 1.0
-        if game.ui_state.gold_display_scale > 1.0:
-            game.ui_state.gold_display_scale = max(
-                1.0, game.ui_state.gold_display_scale - 3.0 * (1 / 60)
+        if ui.gold_display_scale > 1.0:
+            ui.gold_display_scale = max(
+                1.0, ui.gold_display_scale - 3.0 * (1 / 60)
             )  # Decay over time
-        game.ui_state.gold_display_scale += (
-            target_scale - game.ui_state.gold_display_scale
-        ) * 0.15
+        ui.gold_display_scale += (target_scale - ui.gold_display_scale) * 0.15
 
         # Decay gold flash timer
-        if game.ui_state.gold_flash_timer > 0:
-            game.ui_state.gold_flash_timer = max(
-                0, game.ui_state.gold_flash_timer - (1 / 60)
-            )
+        if ui.gold_flash_timer > 0:
+            ui.gold_flash_timer = max(0, ui.gold_flash_timer - (1 / 60))
 
         # Calculate gold text color based on flash timer (supports gain or loss)
-        flash_progress = (
-            game.ui_state.gold_flash_timer / 0.5
-            if game.ui_state.gold_flash_timer > 0
-            else 0
-        )
-        base_color = game.ui_state.gold_flash_color or (255, 255, 255)
+        flash_progress = ui.gold_flash_timer / 0.5 if ui.gold_flash_timer > 0 else 0
+        base_color = ui.gold_flash_color or (255, 255, 255)
         gold_color = tuple(
             int(base_color[i] * flash_progress + 255 * (1 - flash_progress))
             for i in range(3)
         )
 
         # Render gold text with scale effect
-        gold_font_size = int(28 * game.ui_state.gold_display_scale)
-        gold_font = pygame.font.Font(None, gold_font_size)
-        my_hud = gold_font.render(
-            f"Gold: {game.player_state.my_gold}   Lives: {game.player_state.my_lives}",
-            True,
-            gold_color,
-        )
-        opp_hud = font.render(
-            f"Opponent Lives: {game.player_state.opponent_lives}", True, (255, 200, 200)
-        )
+        gold_font_size = int(28 * ui.gold_display_scale)
+        gold_font = self._get_font(gold_font_size)
+        my_text = f"Gold: {ps.my_gold}   Lives: {ps.my_lives}"
+        opp_text = f"Opponent Lives: {ps.opponent_lives}"
+        opp_color = (255, 200, 200)
+
+        # Color and size change every frame during a flash or pulse, so those
+        # frames render directly instead of filling the cache with one-offs
+        gold_animating = ui.gold_flash_timer > 0 or ui.gold_display_scale != 1.0
 
+        # Own stats sit on the player's side, opponent lives on the other
         if game.player_id == "B":
-            right_x = game.display_manager.screen_width - 20 - my_hud.get_width()
+            if gold_animating:
+                my_hud = gold_font.render(my_text, True, gold_color)
+                right_x = screen_w - 20 - my_hud.get_width()
+            else:
+                my_hud, right_x = _render_anchored_text(
+                    gold_font, my_text, gold_color, screen_w - 20, "right"
+                )
             surface.blit(my_hud, (right_x, 20))
-            surface.blit(opp_hud, (20, 20))
+            surface.blit(_render_text(font, opp_text, opp_color), (20, 20))
         else:
+            if gold_animating:
+                my_hud = gold_font.render(my_text, True, gold_color)
+            else:
+                my_hud = _render_text(gold_font, my_text, gold_color)
             surface.blit(my_hud, (20, 20))
-            right_x = game.display_manager.screen_width - 20 - opp_hud.get_width()
+            opp_hud, right_x = _render_anchored_text(
+                font, opp_text, opp_color, screen_w - 20, "right"
+            )
             surface.blit(opp_hud, (right_x, 20))
 
         # Render floating gold change texts
@@ -97,25 +229,30 @@ class HUDRenderer:
         self._render_arrow_projectiles(surface, game)
 
         # 3. Send units buttons with route preview of selected unit type
-        current_time = time.time()
-        selected_type = game.ui_state.selected_unit_type
+        current_time = time.monotonic()
+        last_clicked_route = ui.last_clicked_route
+        click_recent = current_time - ui.click_time < 0.5
+        selected_type = ui.selected_unit_type
         selected_cost = UNIT_STATS.get(selected_type, {}).get("cost", "?")
 
-        for i, rect in enumerate(game.ui_state.barracks_buttons, start=1):
+        buttons = ui.barracks_buttons
+        layout = tuple(tuple(rect) for rect in buttons)
+        if layout != self._route_labels_layout:
+            self._build_route_labels(buttons, font)
+            self._route_labels_layout = layout
+        preview_text = f"Send: {selected_type.capitalize()} (${selected_cost})"
+
+        for i, (rect, (label, label_pos)) in enumerate(
+            zip(buttons, self._route_labels, strict=True), start=1
+        ):
             is_hovered = hovered_route == i
-            is_recently_clicked = (
-                game.ui_state.last_clicked_route == i
-                and current_time - game.ui_state.click_time < 0.5
-            )
+            is_recently_clicked = click_recent and last_clicked_route == i
 
             # Dynamically expand draw rect to fit preview text on hover
             draw_rect = rect.copy()
             if is_hovered:
-                label = f"Route {i}"
-                preview_text = f"Send: {selected_type.capitalize()} (${selected_cost})"
-                label_width = font.size(label)[0]
                 preview_width = font.size(preview_text)[0]
-                needed_w = max(label_width, preview_width) + 20
+                needed_w = max(label.get_width(), preview_width) + 20
                 if needed_w > draw_rect.w:
                     draw_rect.w = needed_w
                     draw_rect.centerx = rect.centerx
@@ -127,24 +264,17 @@ class HUDRenderer:
             else:
                 btn_color = (60, 60, 120)
 
-            pygame.draw.rect(surface, btn_color, draw_rect, border_radius=6)
-            if is_hovered:
-                pygame.draw.rect(
-                    surface, (170, 190, 255), draw_rect, width=2, border_radius=6
-                )
-            label = font.render(f"Route {i}", True, (255, 255, 255))
-            label_rect = label.get_rect(
-                center=(draw_rect.centerx, draw_rect.centery - 6)
+            border_color = (170, 190, 255) if is_hovered else None
+            surface.blit(
+                _render_button(draw_rect.size, btn_color, 6, border_color),
+                draw_rect.topleft,
             )
-            surface.blit(label, label_rect)
+            # Hover only widens draw_rect around the same center
+            surface.blit(label, label_pos)
 
             # Preview the currently selected unit type & cost on hover
             if is_hovered:
-                preview = font.render(
-                    f"Send: {selected_type.capitalize()} (${selected_cost})",
-                    True,
-                    (255, 230, 180),
-                )
+                preview = _render_text(font, preview_text, (255, 230, 180))
                 prev_rect = preview.get_rect(
                     center=(draw_rect.centerx, draw_rect.centery + 10)
                 )
@@ -157,60 +287,56 @@ class HUDRenderer:
         self._render_building_selection_buttons(surface, game, font, mx, my)
 
         # 5. Timers
-        timer_font = pygame.font.Font(None, 32)
-        center_x = game.display_manager.screen_width // 2
-
-        if game.phase_state.in_preparation:
-            prep_text = timer_font.render(
-                f"Prep: {int(game.phase_state.prep_seconds_remaining)}s",
-                True,
+        timer_font = self._get_font(32)
+        center_x = screen_w // 2
+
+        if phase.in_preparation:
+            prep_text, prep_x = self._timer_text(
+                timer_font,
+                "Prep",
+                phase.prep_seconds_remaining,
                 (200, 220, 255),
+                center_x,
             )
-            surface.blit(prep_text, (center_x - prep_text.get_width() // 2, 20))
+            surface.blit(prep_text, (prep_x, 20))
 
-        if game.phase_state.in_combat:
-            combat_text = timer_font.render(
-                f"Combat: {int(game.phase_state.combat_seconds_remaining)}s",
-                True,
+        if phase.in_combat:
+            combat_text, combat_x = self._timer_text(
+                timer_font,
+                "Combat",
+                phase.combat_seconds_remaining,
                 (255, 220, 200),
+                center_x,
             )
-            y = 20 if not game.phase_state.in_preparation else 20 + 24
-            surface.blit(combat_text, (center_x - combat_text.get_width() // 2, y))
+            y = 20 if not phase.in_preparation else 20 + 24
+            surface.blit(combat_text, (combat_x, y))
 
         # 6. Hover overlay for build mode
-        if game.ui_state.tower_build_mode and game.ui_state.hover_tile:
-            my_map = game.map_state.terrain_map
-            row, col = game.ui_state.hover_tile
-            tile_x = my_map.rect.x + col * TILE_SIZE_PX
-            tile_y = my_map.rect.y + row * TILE_SIZE_PX
-            hover_surface = pygame.Surface(
-                (TILE_SIZE_PX, TILE_SIZE_PX), pygame.SRCALPHA
+        if ui.tower_build_mode and ui.hover_tile:
+            row, col = ui.hover_tile
+            tile_x = map_origin[0] + col * TILE_SIZE_PX
+            tile_y = map_origin[1] + row * TILE_SIZE_PX
+            surface.blit(self._hover_surface, (tile_x, tile_y))
+
+        # 7. Debug overlays (off in normal play)
+        debug_renderer = game.sim_state.debug_renderer
+        if debug_renderer.enabled:
+            debug_renderer.draw_grid(
+                surface,
+                game.map_state.center_x,
+                game.map_state.map_width,
+                game.settings.vertical_offset,
+                placement_grid=game.map_state.placement_grid,
+                origin=map_origin,
             )
-            hover_surface.fill((0, 0, 0, 80))
-            surface.blit(hover_surface, (tile_x, tile_y))
-
-        # 7. Debug overlays
-        game.sim_state.debug_renderer.draw_grid(
-            game.display_manager.render_surface,
-            game.map_state.center_x,
-            game.map_state.map_width,
-            game.settings.vertical_offset,
-            placement_grid=game.map_state.placement_grid,
-            origin=(
-                game.map_state.terrain_map.rect.x,
-                game.map_state.terrain_map.rect.y,
-            ),
-        )
-        game.sim_state.debug_renderer.draw_info_text(
-            game.display_manager.render_surface
-        )
+            debug_renderer.draw_info_text(surface)
 
         # 8. Unit selection buttons and tooltip handling
         tooltip_unit_type = None  # Store hovered unit type
 
-        if game.ui_state.unit_selection_buttons:
-            for rect, u_type in game.ui_state.unit_selection_buttons:
-                is_selected = u_type == game.ui_state.selected_unit_type
+        if ui.unit_selection_buttons:
+            for rect, u_type in ui.unit_selection_buttons:
+                is_selected = u_type == selected_type
                 is_hovered = rect.collidepoint(mx, my)
 
                 if is_hovered:
@@ -226,15 +352,16 @@ class HUDRenderer:
                     color = (60, 60, 120)
                     border_color = (100, 100, 100)
 
-                pygame.draw.rect(surface, color, rect, border_radius=6)
-                pygame.draw.rect(surface, border_color, rect, width=2, border_radius=6)
+                surface.blit(
+                    _render_button(rect.size, color, 6, border_color), rect.topleft
+                )
 
-                name_text = font.render(u_type.capitalize(), True, (255, 255, 255))
+                name_text = _render_text(font, u_type.capitalize(), (255, 255, 255))
                 name_rect = name_text.get_rect(center=(rect.centerx, rect.centery - 8))
                 surface.blit(name_text, name_rect)
 
                 cost = UNIT_STATS.get(u_type, {}).get("cost", "?")
-                cost_text = font.render(f"${cost}", True, (255, 215, 0))
+                cost_text = _render_text(font, f"${cost}", (255, 215, 0))
                 cost_rect = cost_text.get_rect(center=(rect.centerx, rect.centery + 10))
                 surface.blit(cost_text, cost_rect)
 
@@ -242,6 +369,44 @@ class HUDRenderer:
         if tooltip_unit_type:
             self._draw_unit_tooltip(surface, mx, my, tooltip_unit_type)
 
+    def _timer_text(
+        self,
+        font: pygame.font.Font,
+        label: str,
+        seconds_remaining: float,
+        color: tuple[int, int, int],
+        center_x: int,
+    ) -> tuple[pygame.Surface, int]:
+        """Return the centered "<label>: Ns" surface and its left x.
+
+        The displayed value only changes once per second, so the previous
+        surface is reused until the whole-second count (or anchor) changes.
+        """
+        seconds = int(seconds_remaining)
+        cached = self._timer_texts.get(label)
+        if cached is not None and cached[0] == seconds and cached[1] == center_x:
+            return cached[2], cached[3]
+
+        text_surf, x = _render_anchored_text(
+            font, f"{label}: {seconds}s", color, center_x, "center"
+        )
+        self._timer_texts[label] = (seconds, center_x, text_surf, x)
+        return text_surf, x
+
+    def _build_route_labels(
+        self, buttons: list[pygame.Rect], font: pygame.font.Font
+    ) -> None:
+        """Pre-render each route button's label and its centered top-left."""
+        self._route_labels = []
+        for i, rect in enumerate(buttons, start=1):
+            label = _render_text(font, f"Route {i}", (255, 255, 255))
+            label_w, label_h = label.get_size()
+            label_pos = (
+                rect.centerx - label_w // 2,
+                rect.centery - 6 - label_h // 2,
+            )
+            self._route_labels.append((label, label_pos))
+
     def _render_route_highlight(
         self, surface: pygame.Surface, game, route: int
     ) -> None:
@@ -250,20 +415,28 @@ class HUDRenderer:
         if player_id not in GAME_PATHS or route not in GAME_PATHS[player_id]:
             return
 
-        path_tiles = GAME_PATHS[player_id][route]
-        my_map = game.map_state.terrain_map
-
-        highlight_color = (255, 220, 100, 100)
-
-        for tile_row, tile_col in path_tiles:
-            tile_x = my_map.rect.x + tile_col * TILE_SIZE_PX
-            tile_y = my_map.rect.y + tile_row * TILE_SIZE_PX
+        # Tile positions only change with the terrain origin, so the blit
+        # sequence is built once per (player, route) and origin
+        origin = game.map_state.terrain_map.rect.topleft
+        if origin != self._route_blits_origin:
+            self._route_blits.clear()
+            self._route_blits_origin = origin
+
+        key = (player_id, route)
+        blit_seq = self._route_blits.get(key)
+        if blit_seq is None:
+            ox, oy = origin
+            highlight = self._highlight_surface
+            blit_seq = self._route_blits[key] = [
+                (
+                    highlight,
+                    (ox + tile_col * TILE_SIZE_PX, oy + tile_row * TILE_SIZE_PX),
+                )
+                for tile_row, tile_col in GAME_PATHS[player_id][route]
+            ]
 
-            highlight_surface = pygame.Surface(
-                (TILE_SIZE_PX, TILE_SIZE_PX), pygame.SRCALPHA
-            )
-            highlight_surface.fill(highlight_color)
-            surface.blit(highlight_surface, (tile_x, tile_y))
+        # One batched blits() call instead of a Python-level blit per tile
+        surface.blits(blit_seq, doreturn=False)
 
     def _render_route_unit_previews(self, surface: pygame.Surface, game) -> None:
         """Render actual unit sprites at the start of each route to show queued units."""
@@ -319,7 +492,7 @@ class HUDRenderer:
             game.ui_state.route_preview_sprites.remove(sprite)
 
         # Store current state for next frame comparison
-        game.ui_state._last_preview_state = {k: list(v) for k, v in previews.items()}
+        game.ui_state._last_preview_state = {k: v.copy() for k, v in previews.items()}
 
         if not previews:
             return
@@ -356,8 +529,6 @@ class HUDRenderer:
                 py = base_y + dy
 
                 # Create actual unit sprite for preview
-                from ..sprites.units import UnitSprite
-
                 anim_dict = template_manager.get_unit_template(u_type, player_id)
 
                 preview_sprite = UnitSprite(
@@ -381,8 +552,6 @@ class HUDRenderer:
         self, surface: pygame.Surface, game, font: pygame.font.Font, mx: int, my: int
     ) -> None:
         """Render building selection buttons above the build button."""
-        from td_shared.game import TOWER_STATS
-
         building_selection_buttons = getattr(
             game.ui_state, "building_selection_buttons", []
         )
@@ -435,18 +604,19 @@ class HUDRenderer:
                 color = base_color
                 border_color = (100, 100, 100)
 
-            pygame.draw.rect(surface, color, rect, border_radius=4)
-            pygame.draw.rect(surface, border_color, rect, width=2, border_radius=4)
+            surface.blit(
+                _render_button(rect.size, color, 4, border_color), rect.topleft
+            )
 
             # Building name - use specific text color for readability
             name_text = building_names.get(b_type, b_type.capitalize())
-            name_surf = font.render(name_text, True, text_color)
+            name_surf = _render_text(font, name_text, text_color)
             name_rect = name_surf.get_rect(center=(rect.centerx, rect.centery - 6))
             surface.blit(name_surf, name_rect)
 
             # Cost - always bright gold/white for visibility
             cost = TOWER_STATS.get(b_type, {}).get("cost", "?")
-            cost_surf = font.render(f"${cost}", True, (255, 255, 100))
+            cost_surf = _render_text(font, f"${cost}", (255, 255, 100))
             cost_rect = cost_surf.get_rect(center=(rect.centerx, rect.centery + 8))
             surface.blit(cost_surf, cost_rect)
 
@@ -458,8 +628,8 @@ class HUDRenderer:
         description_lines = UNIT_DESCRIPTIONS.get(unit_type, ["Unknown Unit"])
 
         # Fonts
-        title_font = pygame.font.Font(None, 26)
-        text_font = pygame.font.Font(None, 22)
+        title_font = self._get_font(26)
+        text_font = self._get_font(22)
 
         # Colors
         bg_color = (20, 20, 30, 230)  # Semi-transparent dark background
@@ -488,9 +658,9 @@ class HUDRenderer:
         rendered_lines = []
         for text, color in lines:
             surf = (
-                title_font.render(text, True, color)
+                _render_text(title_font, text, color)
                 if color == stat_color
-                else text_font.render(text, True, color)
+                else _render_text(text_font, text, color)
             )
             if surf.get_width() > max_width:
                 max_width = surf.get_width()
@@ -535,8 +705,6 @@ class HUDRenderer:
 
     def _render_floating_mine_gold_texts(self, surface: pygame.Surface, game) -> None:
         """Render floating gold indicators at mine positions with white-to-green transition."""
-        import time
-
         current_time = time.time()
         duration = 1.5
 
@@ -572,7 +740,7 @@ class HUDRenderer:
 
             # Render gold amount with larger, bolder font
             font_size = int(24 * scale)  # Bigger font for readability
-            font = pygame.font.Font(None, font_size)
+            font = self._get_font(font_size)
             text_surf = font.render(f"+{text_data['amount']}g", True, color)
             text_surf.set_alpha(alpha)
 
@@ -590,8 +758,6 @@ class HUDRenderer:
 
     def _render_floating_damage_texts(self, surface: pygame.Surface, game) -> None:
         """Render damage indicators from unit damage with proper validation."""
-        import time
-
         current_time = time.time()
         duration = 1.5
 
@@ -649,7 +815,7 @@ class HUDRenderer:
                     continue
 
                 font_size = max(12, int(22 * (1 - progress * 0.3)))
-                font = pygame.font.Font(None, font_size)
+                font = self._get_font(font_size)
                 damage_text = font.render(f"-{amount}", True, color)
 
                 if alpha < 255:
@@ -663,9 +829,6 @@ class HUDRenderer:
 
     def _render_arrow_projectiles(self, surface: pygame.Surface, game) -> None:
         """Render and update arrow projectiles flying from towers to targets."""
-        import math
-        import time
-
         current_time = time.time()
 
         # Filter out completed projectiles
@@ -55,4 +55,6 @@ class InputController:
             assert (
                 event.button == 1
             ), f"Expected left mouse button (1), got {event.button}"
+            # Sampled per click so handlers see the Shift state at this event
+            game.ui_state.current_mods = pygame.key.get_mods()
             self.build_controller.handle_mouse_click(event, game)
@@ -18,10 +18,9 @@ def run_combat_simulation(simulation_data: SimulationData) -> RoundResultData:
     gold_A = game_state.get_gold_earned_by_player("A")
     gold_B = game_state.get_gold_earned_by_player("B")
 
-    result: RoundResultData = {
-        "lives_lost_player_A": lives_lost_player_A,
-        "gold_earned_player_A": gold_A,
-        "lives_lost_player_B": lives_lost_player_B,
-        "gold_earned_player_B": gold_B,
-    }
-    return result
+    return RoundResultData(
+        lives_lost_player_A=lives_lost_player_A,
+        gold_earned_player_A=gold_A,
+        lives_lost_player_B=lives_lost_player_B,
+        gold_earned_player_B=gold_B,
+    )
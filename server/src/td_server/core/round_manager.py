@@ -184,10 +184,10 @@ class RoundManager:
             if self._pending_round_result and self._active_clients:
                 pr = self._pending_round_result
                 rr = game_pb2.RoundResultData(
-                    lives_lost_player_A=int(pr["lives_lost_player_A"]),
-                    gold_earned_player_A=int(pr["gold_earned_player_A"]),
-                    lives_lost_player_B=int(pr["lives_lost_player_B"]),
-                    gold_earned_player_B=int(pr["gold_earned_player_B"]),
+                    lives_lost_player_A=int(pr.lives_lost_player_A),
+                    gold_earned_player_A=int(pr.gold_earned_player_A),
+                    lives_lost_player_B=int(pr.lives_lost_player_B),
+                    gold_earned_player_B=int(pr.gold_earned_player_B),
                     total_lives_player_A=self.game_manager.player_A_lives,
                     total_gold_player_A=self.game_manager.player_A_gold,
                     total_lives_player_B=self.game_manager.player_B_lives,
@@ -216,10 +216,10 @@ class RoundManager:
 
         self._log.info(
             "Combat phase ended: A lost %d, B lost %d, A gold +%d, B gold +%d",
-            result["lives_lost_player_A"],
-            result["lives_lost_player_B"],
-            result["gold_earned_player_A"],
-            result["gold_earned_player_B"],
+            result.lives_lost_player_A,
+            result.lives_lost_player_B,
+            result.gold_earned_player_A,
+            result.gold_earned_player_B,
         )
 
         self.game_manager.apply_round_result(result)
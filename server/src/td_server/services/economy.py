@@ -111,27 +111,21 @@ class EconomyManager:
     def apply_round_result(self, result: RoundResultData) -> None:
         """Update lives/gold according to authoritative round result."""
         # Preconditions
-        assert isinstance(result, dict), "result must be a dict"
-        assert "lives_lost_player_A" in result, "Missing lives_lost_player_A in result"
-        assert "lives_lost_player_B" in result, "Missing lives_lost_player_B in result"
+        assert isinstance(
+            result, RoundResultData
+        ), f"result must be a RoundResultData, not {type(result).__name__}"
         assert (
-            "gold_earned_player_A" in result
-        ), "Missing gold_earned_player_A in result"
+            result.lives_lost_player_A >= 0
+        ), f"lives_lost_player_A must be >= 0, not {result.lives_lost_player_A}"
         assert (
-            "gold_earned_player_B" in result
-        ), "Missing gold_earned_player_B in result"
+            result.lives_lost_player_B >= 0
+        ), f"lives_lost_player_B must be >= 0, not {result.lives_lost_player_B}"
         assert (
-            result["lives_lost_player_A"] >= 0
-        ), f"lives_lost_player_A must be >= 0, not {result['lives_lost_player_A']}"
+            result.gold_earned_player_A >= 0
+        ), f"gold_earned_player_A must be >= 0, not {result.gold_earned_player_A}"
         assert (
-            result["lives_lost_player_B"] >= 0
-        ), f"lives_lost_player_B must be >= 0, not {result['lives_lost_player_B']}"
-        assert (
-            result["gold_earned_player_A"] >= 0
-        ), f"gold_earned_player_A must be >= 0, not {result['gold_earned_player_A']}"
-        assert (
-            result["gold_earned_player_B"] >= 0
-        ), f"gold_earned_player_B must be >= 0, not {result['gold_earned_player_B']}"
+            result.gold_earned_player_B >= 0
+        ), f"gold_earned_player_B must be >= 0, not {result.gold_earned_player_B}"
 
         # Track state before operations
         old_lives_A = self.get_lives("A")
@@ -141,23 +135,23 @@ class EconomyManager:
 
         # Apply operations using functional mapping
         operations = [
-            (self.lose_lives, "A", result["lives_lost_player_A"]),
-            (self.lose_lives, "B", result["lives_lost_player_B"]),
-            (self.add_gold, "A", result["gold_earned_player_A"]),
-            (self.add_gold, "B", result["gold_earned_player_B"]),
+            (self.lose_lives, "A", result.lives_lost_player_A),
+            (self.lose_lives, "B", result.lives_lost_player_B),
+            (self.add_gold, "A", result.gold_earned_player_A),
+            (self.add_gold, "B", result.gold_earned_player_B),
         ]
         list(map(lambda op: op[0](op[1], op[2]), operations))
 
         # Postconditions
         assert (
-            self.get_lives("A") == max(0, old_lives_A - result["lives_lost_player_A"])
-        ), f"Player A lives not correctly updated: expected {max(0, old_lives_A - result['lives_lost_player_A'])}, got {self.get_lives('A')}"
+            self.get_lives("A") == max(0, old_lives_A - result.lives_lost_player_A)
+        ), f"Player A lives not correctly updated: expected {max(0, old_lives_A - result.lives_lost_player_A)}, got {self.get_lives('A')}"
         assert (
-            self.get_lives("B") == max(0, old_lives_B - result["lives_lost_player_B"])
-        ), f"Player B lives not correctly updated: expected {max(0, old_lives_B - result['lives_lost_player_B'])}, got {self.get_lives('B')}"
+            self.get_lives("B") == max(0, old_lives_B - result.lives_lost_player_B)
+        ), f"Player B lives not correctly updated: expected {max(0, old_lives_B - result.lives_lost_player_B)}, got {self.get_lives('B')}"
         assert (
-            self.get_gold("A") == old_gold_A + result["gold_earned_player_A"]
-        ), f"Player A gold not correctly updated: expected {old_gold_A + result['gold_earned_player_A']}, got {self.get_gold('A')}"
+            self.get_gold("A") == old_gold_A + result.gold_earned_player_A
+        ), f"Player A gold not correctly updated: expected {old_gold_A + result.gold_earned_player_A}, got {self.get_gold('A')}"
         assert (
-            self.get_gold("B") == old_gold_B + result["gold_earned_player_B"]
-        ), f"Player B gold not correctly updated: expected {old_gold_B + result['gold_earned_player_B']}, got {self.get_gold('B')}"
+            self.get_gold("B") == old_gold_B + result.gold_earned_player_B
+        ), f"Player B gold not correctly updated: expected {old_gold_B + result.gold_earned_player_B}, got {self.get_gold('B')}"
@@ -1,13 +1,13 @@
 """Protocol definitions for client-server communication.
 
-This module defines the data structures (TypedDict) that represent the messages
-exchanged between server and client during the game phases. These structures
-serve as contracts for the deterministic lockstep simulation.
+This module defines the data structures (TypedDict, NamedTuple) that represent
+the messages exchanged between server and client during the game phases. These
+structures serve as contracts for the deterministic lockstep simulation.
 
 These TypedDicts mirror the data structures used by our gRPC protobuf definitions
 and act as type-safe Python contracts for server and client code.
 """
-from typing import List, Literal, TypedDict
+from typing import List, Literal, NamedTuple, TypedDict
 
 
 PlayerID = Literal["A", "B"]
@@ -78,11 +78,12 @@ class RoundStartData(TypedDict):
     simulation_data: SimulationData
 
 
-class RoundResultData(TypedDict):
+class RoundResultData(NamedTuple):
     """Round result message data.
     
     Sent from server to client after simulation completes.
-    Contains the authoritative results that override any client-side calculations
+    Contains the authoritative results that override any client-side calculations.
+    Immutable four-int record; use to_dict() at serialization boundaries.
     
     Attributes:
         lives_lost_player_A: Number of lives lost by player A
@@ -95,3 +96,7 @@ class RoundResultData(TypedDict):
     lives_lost_player_B: int
     gold_earned_player_B: int
 
+    def to_dict(self) -> dict[str, int]:
+        """Return the result as a plain dict keyed by field name."""
+        return self._asdict()
+
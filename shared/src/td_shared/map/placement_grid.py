@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from ..game.game_balance import (
     TILE_SIZE_PX,
     ZONE_BOUNDARY_LEFT,
@@ -12,7 +14,7 @@ from .static_map import TILE_TYPE_GRASS, TILE_TYPE_PATH
 class PlacementGrid:
     """Logical grid for build validation"""
 
-    def __init__(self, layout: list[list[int]]) -> None:
+    def __init__(self, layout: Sequence[Sequence[int]]) -> None:
         self.height_tiles = len(layout)
         self.width_tiles = len(layout[0])
         self.grid: list[list[GridCellState]] = [
@@ -21,7 +23,7 @@ class PlacementGrid:
         ]
         self._populate_from_layout(layout)
 
-    def _populate_from_layout(self, layout: list[list[int]]) -> None:
+    def _populate_from_layout(self, layout: Sequence[Sequence[int]]) -> None:
         """Mark all non-grass tiles as blocked based on the static map layout."""
         for row_idx, row in enumerate(layout):
             for col_idx, tile_type in enumerate(row):
@@ -5,7 +5,9 @@ TILE_TYPE_GRASS = 0
 TILE_TYPE_PATH = 1
 TILE_TYPE_WATER = 2
 
-GLOBAL_MAP_LAYOUT = [
+VALID_TILE_TYPES = frozenset({TILE_TYPE_GRASS, TILE_TYPE_PATH, TILE_TYPE_WATER})
+
+_RAW_LAYOUT = [
     [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
     [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0],
     [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0],
@@ -32,3 +34,28 @@ GLOBAL_MAP_LAYOUT = [
     [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0],
     [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 ]
+
+# Rows are stored as bytes, one byte per tile: indexing a row still yields
+# ints, while tile counts run in C through bytes.count
+GLOBAL_MAP_LAYOUT = tuple(bytes(row) for row in _RAW_LAYOUT)
+del _RAW_LAYOUT
+
+MAP_HEIGHT_TILES = len(GLOBAL_MAP_LAYOUT)
+# First column of the right half
+MAP_MID_X = len(GLOBAL_MAP_LAYOUT[0]) // 2
+
+# The whole map as one flat row-major buffer
+MAP_TILES = b"".join(GLOBAL_MAP_LAYOUT)
+
+# Layout aggregates, computed once at import time
+GRASS_COUNT = MAP_TILES.count(TILE_TYPE_GRASS)
+PATH_COUNT = MAP_TILES.count(TILE_TYPE_PATH)
+WATER_COUNT = MAP_TILES.count(TILE_TYPE_WATER)
+
+ROW_LENGTHS_UNIFORM = len({len(row) for row in GLOBAL_MAP_LAYOUT}) == 1
+
+# Left and right column halves of every row, joined into one buffer each
+LEFT_HALF_TILES = b"".join(row[:MAP_MID_X] for row in GLOBAL_MAP_LAYOUT)
+RIGHT_HALF_TILES = b"".join(row[MAP_MID_X:] for row in GLOBAL_MAP_LAYOUT)
+LEFT_HALF_GRASS = LEFT_HALF_TILES.count(TILE_TYPE_GRASS)
+RIGHT_HALF_GRASS = RIGHT_HALF_TILES.count(TILE_TYPE_GRASS)
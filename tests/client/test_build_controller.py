@@ -0,0 +1,152 @@
+"""Tests for build controller gold batching and local building bookkeeping."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from td_shared.game import UNIT_STATS
+
+from client.src.td_client.simulation.game_states import PlayerState, UIState
+from client.src.td_client.ui.build_controller import BuildController, building_key
+
+
+def make_game(gold: int = 100) -> SimpleNamespace:
+    """Create a minimal game stand-in; no display or assets needed."""
+    return SimpleNamespace(
+        player_id="A",
+        event_bus=Mock(),
+        ui_state=UIState(),
+        player_state=PlayerState(my_gold=gold),
+        render_manager=Mock(),
+        get_player_grid=Mock(),
+    )
+
+
+class TestBuildingKey:
+    """Tests for the packed building key."""
+
+    def test_players_do_not_collide(self):
+        """Test that the same tile gives different keys for A and B."""
+        assert building_key("A", 3, 7) != building_key("B", 3, 7)
+
+    def test_keys_unique_across_tiles(self):
+        """Test that every (player, row, col) maps to its own key."""
+        keys = {
+            building_key(player_id, row, col)
+            for player_id in ("A", "B")
+            for row in range(20)
+            for col in range(40)
+        }
+        assert len(keys) == 2 * 20 * 40
+
+    def test_rejects_unpackable_input(self):
+        """Test that ids and columns the packing cannot hold fail loudly."""
+        with pytest.raises(AssertionError):
+            building_key("C", 3, 7)
+        with pytest.raises(AssertionError):
+            building_key("A", 3, 256)
+
+
+class TestFlushGold:
+    """Tests for coalescing gold changes into one event per frame."""
+
+    def test_two_sends_publish_one_event(self):
+        """Test that two unit sends produce a single aggregated GoldChangedEvent."""
+        game = make_game(gold=100)
+        controller = BuildController(game)
+        cost = int(UNIT_STATS[game.ui_state.selected_unit_type]["cost"])
+
+        controller._request_send_units(game, 1)
+        controller._request_send_units(game, 2)
+        game.event_bus.publish.assert_not_called()
+
+        controller.flush_gold()
+
+        game.event_bus.publish.assert_called_once()
+        event = game.event_bus.publish.call_args.args[0]
+        assert event.delta == -2 * cost
+        assert event.new_gold == 100 - 2 * cost
+        assert event.new_gold == game.player_state.my_gold
+
+    def test_flush_without_changes_publishes_nothing(self):
+        """Test that flushing with nothing pending stays silent."""
+        game = make_game()
+        controller = BuildController(game)
+
+        controller.flush_gold()
+
+        game.event_bus.publish.assert_not_called()
+
+    def test_flush_resets_pending_delta(self):
+        """Test that a second flush does not republish the same change."""
+        game = make_game()
+        controller = BuildController(game)
+
+        controller._request_send_units(game, 1)
+        controller.flush_gold()
+        controller.flush_gold()
+
+        assert game.event_bus.publish.call_count == 1
+
+
+class TestRemoveTower:
+    """Tests for removing locally spawned buildings."""
+
+    def test_remove_gold_mine(self):
+        """Test that removing a gold mine drops its sprite and mine key."""
+        game = make_game()
+        controller = BuildController(game)
+        key = building_key("A", 4, 5)
+        sprite = Mock()
+        game.ui_state.local_buildings[key] = sprite
+        game.ui_state.gold_mine_keys.add(key)
+
+        assert controller.remove_tower("A", 4, 5)
+
+        sprite.kill.assert_called_once()
+        assert key not in game.ui_state.local_buildings
+        assert key not in game.ui_state.gold_mine_keys
+
+    def test_remove_missing_tower(self):
+        """Test that removing an empty tile reports nothing removed."""
+        game = make_game()
+        controller = BuildController(game)
+
+        assert not controller.remove_tower("A", 4, 5)
+
+    def test_rollback_removes_gold_mine(self):
+        """Test that a rejected build refunds gold and drops the mine."""
+        game = make_game(gold=50)
+        controller = BuildController(game)
+        key = building_key("A", 2, 3)
+        sprite = Mock()
+        game.ui_state.local_buildings[key] = sprite
+        game.ui_state.gold_mine_keys.add(key)
+        event = SimpleNamespace(
+            tile_row=2, tile_col=3, was_empty=True, tower_type="gold_mine"
+        )
+
+        controller._rollback_build(event, 25)
+
+        assert game.player_state.my_gold == 75
+        sprite.kill.assert_called_once()
+        assert key not in game.ui_state.local_buildings
+        assert key not in game.ui_state.gold_mine_keys
+        game.get_player_grid.return_value.clear_tower.assert_called_once_with(2, 3)
+
+
+class TestSendUnitsResponse:
+    """Tests for syncing gold from send units responses."""
+
+    def test_send_units_ack_is_sync_correction(self):
+        """Test that a server gold resync is not published as a gain or spend."""
+        game = make_game(gold=40)
+        controller = BuildController(game)
+
+        controller._on_send_units_response(
+            SimpleNamespace(success=True, total_gold=60, route=1)
+        )
+
+        event = game.event_bus.publish.call_args.args[0]
+        assert event.delta == 20
+        assert event.sync_correction
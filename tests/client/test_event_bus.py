@@ -150,6 +150,22 @@ class TestEventBus:
         # Should be received immediately without process_pending
         assert len(received) == 1
 
+    def test_post_defers_dispatch(self):
+        """Test that posted events are only dispatched by process_pending."""
+        bus = EventBus()
+        bus.set_main_thread()
+        received = []
+
+        bus.subscribe(RoundStartEvent, lambda e: received.append(e))
+        bus.post(RoundStartEvent(round_start_pb=None))
+
+        # Posting never dispatches inline, even on the main thread
+        assert len(received) == 0
+
+        count = bus.process_pending()
+        assert count == 1
+        assert len(received) == 1
+
     def test_clear(self):
         """Test clearing all subscriptions and pending events."""
         bus = EventBus()
@@ -36,3 +36,35 @@ class TestGameStates:
         from client.src.td_client.simulation import game_states
         
         assert game_states is not None
+
+
+class TestUIStateSelectBuilding:
+    """Tests for the cached building selection on UIState."""
+
+    def test_default_selection_is_cached(self):
+        """Test that the default building's stats and cost are cached on init."""
+        from td_shared.game import TOWER_STATS
+
+        ui_state = UIState()
+
+        assert ui_state.selected_building_stats is TOWER_STATS["standard"]
+        assert ui_state.selected_building_cost == int(TOWER_STATS["standard"]["cost"])
+
+    def test_select_building_updates_cache(self):
+        """Test that selecting a building refreshes its cached stats and cost."""
+        from td_shared.game import TOWER_STATS
+
+        ui_state = UIState()
+        ui_state.select_building("gold_mine")
+
+        assert ui_state.selected_building_type == "gold_mine"
+        assert ui_state.selected_building_stats is TOWER_STATS["gold_mine"]
+        assert ui_state.selected_building_cost == int(TOWER_STATS["gold_mine"]["cost"])
+
+    def test_select_unknown_building(self):
+        """Test that an unknown building clears the cached stats and cost."""
+        ui_state = UIState()
+        ui_state.select_building("no_such_building")
+
+        assert ui_state.selected_building_stats is None
+        assert ui_state.selected_building_cost == 0
@@ -46,14 +46,14 @@ def test_tower_kills_unit():
     # We check if Player A (whose base is under attack)
     # lost ZERO lives, because the unit should have been intercepted.
     assert (
-        result["lives_lost_player_A"] == 0
+        result.lives_lost_player_A == 0
     ), "Player A should not lose a life because the unit should be killed."
 
     # Player B was not attacked, so they should not lose any lives either.
-    assert result["lives_lost_player_B"] == 0
+    assert result.lives_lost_player_B == 0
 
     # Player A should get gold for the kill.
-    assert result["gold_earned_player_A"] > 0
+    assert result.gold_earned_player_A > 0
 
     # Player B should get no gold.
-    assert result["gold_earned_player_B"] == 0
+    assert result.gold_earned_player_B == 0
@@ -1,3 +1,5 @@
+from td_shared.game import RoundResultData
+
 from server.src.td_server.services.economy import EconomyManager
 
 
@@ -64,3 +66,24 @@ def test_lives_cannot_go_below_zero():
 
     # Assert
     assert economy.get_lives("A") == 0
+
+
+def test_apply_round_result():
+    """Apply an authoritative round result to both players."""
+    # Arrange
+    economy = EconomyManager(initial_lives=20, initial_gold=100)
+    result = RoundResultData(
+        lives_lost_player_A=1,
+        gold_earned_player_A=5,
+        lives_lost_player_B=2,
+        gold_earned_player_B=7,
+    )
+
+    # Act
+    economy.apply_round_result(result)
+
+    # Assert
+    assert economy.get_lives("A") == 19
+    assert economy.get_gold("A") == 105
+    assert economy.get_lives("B") == 18
+    assert economy.get_gold("B") == 107
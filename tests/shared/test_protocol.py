@@ -2,21 +2,75 @@
 
 import pytest
 
+from td_shared.game import PLAYER_A, PLAYER_B
 from td_shared.game.protocol import (
     PlayerID,
     RoundResultData,
     SimTowerData,
     SimUnitData,
-    SimulationData,
 )
 
 # RoundPhase not implemented yet
 # from td_shared.game.protocol import RoundPhase
 
+# Canonical payloads shared by the tests below. Tests only read them; copy a
+# template and set the differing keys when a variant is needed.
+_TOWER_A: SimTowerData = {
+    "player_id": PLAYER_A,
+    "tower_type": "standard",
+    "position_x": 100.0,
+    "position_y": 200.0,
+    "level": 1,
+}
+_TOWER_BASE: SimTowerData = {**_TOWER_A, "position_x": 0.0, "position_y": 0.0}
+
+_UNIT_A: SimUnitData = {
+    "player_id": PLAYER_A,
+    "unit_type": "standard",
+    "route": 1,
+    "spawn_tick": 0,
+}
+_UNIT_B: SimUnitData = {**_UNIT_A, "player_id": PLAYER_B}
+
+_RESULT = RoundResultData(
+    lives_lost_player_A=2,
+    gold_earned_player_A=15,
+    lives_lost_player_B=3,
+    gold_earned_player_B=20,
+)
+_RESULT_NO_DAMAGE = RoundResultData(
+    lives_lost_player_A=0,
+    gold_earned_player_A=10,
+    lives_lost_player_B=0,
+    gold_earned_player_B=10,
+)
+_RESULT_ASYMMETRIC = RoundResultData(
+    lives_lost_player_A=0,
+    gold_earned_player_A=50,
+    lives_lost_player_B=5,
+    gold_earned_player_B=5,
+)
+
+
+@pytest.fixture(scope="module")
+def sample_tower() -> SimTowerData:
+    """Standard tower owned by player A, shared by the whole module."""
+    return _TOWER_A
+
+
+@pytest.fixture(scope="module")
+def sample_unit() -> SimUnitData:
+    """Pawn sent by player B on route 1, shared by the whole module."""
+    unit = _UNIT_B.copy()
+    unit["unit_type"] = "pawn"
+    return unit
+
 
 class TestProtocolTypes:
     """Tests for protocol type definitions."""
 
+    __slots__ = ()
+
     def test_player_id_type(self):
         """Test that PlayerID accepts valid values."""
         player_a: PlayerID = "A"
@@ -29,15 +83,11 @@ class TestProtocolTypes:
 class TestSimTowerData:
     """Tests for SimTowerData TypedDict."""
 
+    __slots__ = ()
+
     def test_sim_tower_data_creation(self):
         """Test creating a valid SimTowerData dict."""
-        tower: SimTowerData = {
-            "player_id": "A",
-            "tower_type": "standard",
-            "position_x": 100.0,
-            "position_y": 200.0,
-            "level": 1,
-        }
+        tower = _TOWER_A
         
         assert tower["player_id"] == "A"
         assert tower["tower_type"] == "standard"
@@ -45,69 +95,54 @@ class TestSimTowerData:
         assert tower["position_y"] == 200.0
         assert tower["level"] == 1
 
-    def test_sim_tower_data_all_types(self):
+    @pytest.mark.parametrize(
+        "tower_type", ["standard", "wood_tower", "gold_mine", "castle_archer"]
+    )
+    def test_sim_tower_data_all_types(self, tower_type):
         """Test creating towers of different types."""
-        tower_types = ["standard", "wood_tower", "gold_mine", "castle_archer"]
-        
-        for tower_type in tower_types:
-            tower: SimTowerData = {
-                "player_id": "A",
-                "tower_type": tower_type,
-                "position_x": 0.0,
-                "position_y": 0.0,
-                "level": 1,
-            }
-            assert tower["tower_type"] == tower_type
+        tower = _TOWER_BASE.copy()
+        tower["tower_type"] = tower_type
+        assert tower["tower_type"] == tower_type
 
 
 class TestSimUnitData:
     """Tests for SimUnitData TypedDict."""
 
+    __slots__ = ()
+
     def test_sim_unit_data_creation(self):
         """Test creating a valid SimUnitData dict."""
-        unit: SimUnitData = {
-            "player_id": "A",
-            "unit_type": "standard",
-            "route": 1,
-            "spawn_tick": 0,
-        }
+        unit = _UNIT_A
         
         assert unit["player_id"] == "A"
         assert unit["unit_type"] == "standard"
         assert unit["route"] == 1
         assert unit["spawn_tick"] == 0
 
-    def test_sim_unit_data_all_types(self):
+    @pytest.mark.parametrize("unit_type", ["standard", "pawn", "archer"])
+    def test_sim_unit_data_all_types(self, unit_type):
         """Test creating units of different types."""
-        unit_types = ["standard", "pawn", "archer"]
-        
-        for unit_type in unit_types:
-            unit: SimUnitData = {
-                "player_id": "B",
-                "unit_type": unit_type,
-                "route": 2,
-                "spawn_tick": 0,
-            }
-            assert unit["unit_type"] == unit_type
-
-    def test_sim_unit_data_different_routes(self):
+        unit = _UNIT_B.copy()
+        unit["unit_type"] = unit_type
+        unit["route"] = 2
+        assert unit["unit_type"] == unit_type
+
+    @pytest.mark.parametrize("route", [1, 2, 3])
+    def test_sim_unit_data_different_routes(self, route):
         """Test creating units with different routes."""
-        for route in [1, 2, 3]:
-            unit: SimUnitData = {
-                "player_id": "A",
-                "unit_type": "standard",
-                "route": route,
-                "spawn_tick": 0,
-            }
-            assert unit["route"] == route
+        unit = _UNIT_A.copy()
+        unit["route"] = route
+        assert unit["route"] == route
 
 
 class TestSimulationData:
     """Tests for SimulationData TypedDict."""
 
+    __slots__ = ()
+
     def test_simulation_data_creation(self):
         """Test creating a valid SimulationData dict."""
-        sim_data: SimulationData = {
+        sim_data = {
             "tick_rate": 20,
             "towers": [],
             "units": [],
@@ -117,72 +152,26 @@ class TestSimulationData:
         assert sim_data["towers"] == []
         assert sim_data["units"] == []
 
-    def test_simulation_data_with_towers(self):
+    def test_simulation_data_with_towers(self, sample_tower):
         """Test SimulationData with tower list."""
-        towers: list[SimTowerData] = [
-            {
-                "player_id": "A",
-                "tower_type": "standard",
-                "position_x": 100.0,
-                "position_y": 200.0,
-                "level": 1,
-            }
-        ]
-        
-        sim_data: SimulationData = {
-            "tick_rate": 20,
-            "towers": towers,
-            "units": [],
-        }
+        sim_data = {"tick_rate": 20, "towers": [sample_tower], "units": []}
         
         assert len(sim_data["towers"]) == 1
         assert sim_data["towers"][0]["tower_type"] == "standard"
 
-    def test_simulation_data_with_units(self):
+    def test_simulation_data_with_units(self, sample_unit):
         """Test SimulationData with unit list."""
-        units: list[SimUnitData] = [
-            {
-                "player_id": "B",
-                "unit_type": "pawn",
-                "route": 1,
-                "spawn_tick": 0,
-            }
-        ]
-        
-        sim_data: SimulationData = {
-            "tick_rate": 20,
-            "towers": [],
-            "units": units,
-        }
+        sim_data = {"tick_rate": 20, "towers": [], "units": [sample_unit]}
         
         assert len(sim_data["units"]) == 1
         assert sim_data["units"][0]["unit_type"] == "pawn"
 
-    def test_simulation_data_with_both(self):
+    def test_simulation_data_with_both(self, sample_tower, sample_unit):
         """Test SimulationData with both towers and units."""
-        towers: list[SimTowerData] = [
-            {
-                "player_id": "A",
-                "tower_type": "standard",
-                "position_x": 100.0,
-                "position_y": 200.0,
-                "level": 1,
-            }
-        ]
-        
-        units: list[SimUnitData] = [
-            {
-                "player_id": "B",
-                "unit_type": "standard",
-                "route": 1,
-                "spawn_tick": 0,
-            }
-        ]
-        
-        sim_data: SimulationData = {
+        sim_data = {
             "tick_rate": 20,
-            "towers": towers,
-            "units": units,
+            "towers": [sample_tower],
+            "units": [sample_unit],
         }
         
         assert len(sim_data["towers"]) == 1
@@ -190,43 +179,39 @@ class TestSimulationData:
 
 
 class TestRoundResultData:
-    """Tests for RoundResultData TypedDict."""
+    """Tests for RoundResultData NamedTuple."""
+
+    __slots__ = ()
 
     def test_round_result_data_creation(self):
-        """Test creating a valid RoundResultData dict."""
-        result: RoundResultData = {
-            "lives_lost_player_A": 2,
-            "lives_lost_player_B": 3,
-            "gold_earned_player_A": 15,
-            "gold_earned_player_B": 20,
-        }
+        """Test creating a valid RoundResultData."""
+        result = _RESULT
         
-        assert result["lives_lost_player_A"] == 2
-        assert result["lives_lost_player_B"] == 3
-        assert result["gold_earned_player_A"] == 15
-        assert result["gold_earned_player_B"] == 20
+        assert result.lives_lost_player_A == 2
+        assert result.lives_lost_player_B == 3
+        assert result.gold_earned_player_A == 15
+        assert result.gold_earned_player_B == 20
 
     def test_round_result_data_no_damage(self):
         """Test round result with no damage taken."""
-        result: RoundResultData = {
-            "lives_lost_player_A": 0,
-            "lives_lost_player_B": 0,
-            "gold_earned_player_A": 10,
-            "gold_earned_player_B": 10,
-        }
+        result = _RESULT_NO_DAMAGE
         
-        assert result["lives_lost_player_A"] == 0
-        assert result["lives_lost_player_B"] == 0
+        assert result.lives_lost_player_A == 0
+        assert result.lives_lost_player_B == 0
 
     def test_round_result_data_asymmetric(self):
         """Test round result with asymmetric outcome."""
-        result: RoundResultData = {
-            "lives_lost_player_A": 0,
-            "lives_lost_player_B": 5,
-            "gold_earned_player_A": 50,
-            "gold_earned_player_B": 5,
-        }
+        result = _RESULT_ASYMMETRIC
         
         # Player A defended well, earned more gold
-        assert result["lives_lost_player_A"] < result["lives_lost_player_B"]
-        assert result["gold_earned_player_A"] > result["gold_earned_player_B"]
+        assert result.lives_lost_player_A < result.lives_lost_player_B
+        assert result.gold_earned_player_A > result.gold_earned_player_B
+
+    def test_round_result_data_to_dict(self):
+        """Test converting a round result to a plain dict."""
+        assert _RESULT.to_dict() == {
+            "lives_lost_player_A": 2,
+            "gold_earned_player_A": 15,
+            "lives_lost_player_B": 3,
+            "gold_earned_player_B": 20,
+        }